@@ -1,9 +1,11 @@
-import picar_4wd as fc
+from motor_supervisor import MotorSupervisor
 import time
 
 POWER = 50
 SECONDS_PER_POINT = 0.25
 
+motors = MotorSupervisor()
+
 # moves the car based on score changes between home and away teams
 def move_for_score(home_delta, away_delta):
     net_points = home_delta - away_delta
@@ -15,38 +17,36 @@ def move_for_score(home_delta, away_delta):
     
     if net_points > 0:
         direction = 'forward'
-        fc.forward(POWER)
     else:
         direction = 'backward'
-        fc.backward(POWER)
     
-    time.sleep(duration)
-    fc.stop()
+    drive = motors.drive(direction, POWER, duration)
+    
+    points = abs(net_points)
+    if drive.capped:
+        points = int(motors.max_run_seconds / SECONDS_PER_POINT)
     
     return {
         'moved': True,
         'direction': direction,
-        'points': abs(net_points),
-        'duration': duration
+        'points': points,
+        'duration': drive.driven,
+        'capped': drive.capped
     }
 
 # moves the car forward for a given number of points
 def move_forward_points(points):
     duration = points * SECONDS_PER_POINT
-    fc.forward(POWER)
-    time.sleep(duration)
-    fc.stop()
+    motors.drive('forward', POWER, duration)
 
 # moves the car backward for a given number of points
 def move_backward_points(points):
     duration = points * SECONDS_PER_POINT
-    fc.backward(POWER)
-    time.sleep(duration)
-    fc.stop()
+    motors.drive('backward', POWER, duration)
 
 # stops the car motors
 def stop():
-    fc.stop()
+    motors.stop()
 
 # runs test scenarios to verify car movement logic
 def test_scoring_scenarios():
@@ -80,10 +80,14 @@ def test_scoring_scenarios():
     print("=" * 60)
 
 if __name__ == "__main__":
+    motors.start()
+    motors.install_signal_handlers()
+    
     try:
         test_scoring_scenarios()
     except KeyboardInterrupt:
         print("\n\nTest interrupted.")
     finally:
-        fc.stop()
-        print("Motors stopped.")
\ No newline at end of file
+        motors.close()
+        stats = motors.stats()
+        print(f"Motors stopped. Worst-case stop latency: {stats['worst_stop_latency'] * 1000:.1f} ms")
\ No newline at end of file
@@ -1,5 +1,5 @@
 from nba_api.live.nba.endpoints import scoreboard
-import picar_4wd as fc
+from motor_supervisor import MotorSupervisor
 import time
 from datetime import datetime
 
@@ -7,6 +7,8 @@ POLL_INTERVAL_SECONDS = 15
 POWER = 50
 SECONDS_PER_POINT = 0.25
 
+motors = MotorSupervisor()
+
 # fetches all games from the nba api
 def fetch_all_games():
     board = scoreboard.ScoreBoard()
@@ -32,32 +34,37 @@ def get_game_info(game):
     }
 
 # moves the car in a given direction for a number of points
+# returns the points actually moved, which is less if the drive was capped,
+# and whether it was capped
 def move_car(direction, points):
     duration = points * SECONDS_PER_POINT
+    drive = motors.drive(direction, POWER, duration)
     
-    if direction == 'forward':
-        fc.forward(POWER)
-    else:
-        fc.backward(POWER)
-    
-    time.sleep(duration)
-    fc.stop()
+    if drive.capped:
+        return int(motors.max_run_seconds / SECONDS_PER_POINT), True
+    return points, False
 
 # processes score changes and moves the car accordingly
+# returns a message and the signed number of points the car actually moved
 def handle_score_change(home_delta, away_delta, home_team, away_team):
     net_points = home_delta - away_delta
     
     if net_points == 0:
         if home_delta > 0:
-            return f"Both teams scored {home_delta} - no net movement"
-        return None
+            return f"Both teams scored {home_delta} - no net movement", 0
+        return None, 0
     
     if net_points > 0:
-        move_car('forward', abs(net_points))
-        return f"FORWARD {abs(net_points)} point(s) - {home_team} scoring!"
+        moved, capped = move_car('forward', net_points)
+        message = f"FORWARD {moved} point(s) - {home_team} scoring!"
     else:
-        move_car('backward', abs(net_points))
-        return f"BACKWARD {abs(net_points)} point(s) - {away_team} scoring!"
+        moved, capped = move_car('backward', abs(net_points))
+        message = f"BACKWARD {moved} point(s) - {away_team} scoring!"
+    
+    if capped:
+        message += f" (capped from {abs(net_points)})"
+    
+    return message, moved if net_points > 0 else -moved
 
 # displays available games and lets user select one to track
 def display_games_and_select():
@@ -174,16 +181,15 @@ def run_tracker(game_id):
                     if away_delta > 0:
                         print(f"    {away_team} (AWAY) +{away_delta}")
                     
-                    result = handle_score_change(home_delta, away_delta, home_team, away_team)
+                    result, moved = handle_score_change(home_delta, away_delta, home_team, away_team)
                     
                     if result:
                         print(f"    CAR: {result}")
                         
-                        net = home_delta - away_delta
-                        if net > 0:
-                            total_forward += net
+                        if moved > 0:
+                            total_forward += moved
                         else:
-                            total_backward += abs(net)
+                            total_backward += abs(moved)
                     
                     print(f"    New score: {away_team} {info['away_score']} - {home_team} {info['home_score']}")
                     print(f"    Car position: +{total_forward} / -{total_backward} points from start")
@@ -232,6 +238,9 @@ if __name__ == "__main__":
     print("Away team scores → Car moves BACKWARD")
     print()
     
+    motors.start()
+    motors.install_signal_handlers()
+    
     try:
         game_id = display_games_and_select()
         
@@ -241,5 +250,7 @@ if __name__ == "__main__":
             print("\nNo game selected. Exiting.")
     
     finally:
-        fc.stop()
-        print("\nMotors stopped. Goodbye!")
\ No newline at end of file
+        motors.close()
+        stats = motors.stats()
+        print(f"\nMotors stopped. Worst-case stop latency: {stats['worst_stop_latency'] * 1000:.1f} ms over {stats['stops']} stop(s)")
+        print("Goodbye!")
\ No newline at end of file
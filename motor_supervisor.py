@@ -0,0 +1,280 @@
+import queue
+import signal
+import threading
+import time
+
+MAX_RUN_SECONDS = 10.0
+HEARTBEAT_TIMEOUT_SECONDS = 1.0
+SIGNAL_STOP_WAIT_SECONDS = 0.5
+DRIVE_STOP_MARGIN_SECONDS = 0.5
+
+# tracks one drive command until its motors stop
+class Drive:
+    def __init__(self, direction, power, requested, capped):
+        self.direction = direction
+        self.power = power
+        self.requested = requested
+        self.capped = capped
+        self.driven = 0.0
+        self.stop_reason = None
+        self.error = None
+        self.issued_at = None
+        self.started_at = None
+        self.done = threading.Event()
+
+# runs all motor calls on a dedicated thread and stops the motors on missed
+# deadlines, missed heartbeats, or signals
+#
+# every drive is bounded by its deadline. blocking drives rely on the deadline
+# alone, since the caller is parked waiting for them. non-blocking drives are
+# also stopped if the caller stops calling heartbeat()
+class MotorSupervisor:
+    def __init__(self, backend=None, max_run_seconds=MAX_RUN_SECONDS,
+                 heartbeat_timeout=HEARTBEAT_TIMEOUT_SECONDS):
+        if backend is None:
+            import picar_4wd as backend
+
+        self.backend = backend
+        self.max_run_seconds = max_run_seconds
+        self.heartbeat_timeout = heartbeat_timeout
+
+        # SimpleQueue.put is reentrant, so the signal handler can queue a stop
+        # even if it interrupts the main thread inside drive() or stop()
+        self._commands = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._last_heartbeat = time.monotonic()
+
+        self._running = False
+        self._deadline = None
+        self._watch_heartbeat = False
+        self._active_drive = None
+
+        self._stop_count = 0
+        self._worst_stop_latency = 0.0
+        self._worst_stop_reason = None
+        self._last_stop_reason = None
+
+    # starts the supervisor thread
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self.heartbeat()
+        self._thread = threading.Thread(target=self._run, name="motor-supervisor", daemon=True)
+        self._thread.start()
+
+    # stops the motors and shuts down the supervisor thread
+    def close(self, timeout=1.0):
+        if self._thread is None or not self._thread.is_alive():
+            self.backend.stop()
+            return
+
+        self._commands.put(('shutdown', time.monotonic(), None))
+        self._thread.join(timeout)
+
+        if self._thread.is_alive():
+            print("Motor supervisor did not respond, stopping motors directly")
+            self.backend.stop()
+
+    # tells the supervisor the caller is still alive
+    def heartbeat(self):
+        self._last_heartbeat = time.monotonic()
+
+    # drives the motors in a direction for a duration, waiting until they stop
+    # unless wait is False, in which case the caller must keep calling heartbeat()
+    # returns the Drive, whose driven field holds the seconds actually driven
+    # raises RuntimeError if a blocking drive's motor command failed
+    def drive(self, direction, power, duration, wait=True):
+        if direction not in ('forward', 'backward'):
+            raise ValueError(f"Unknown direction: {direction}")
+        if self._thread is None or not self._thread.is_alive():
+            raise RuntimeError("Motor supervisor is not running")
+
+        capped = duration > self.max_run_seconds
+        if capped:
+            print(f"Drive capped at {self.max_run_seconds:.2f}s (requested {duration:.2f}s)")
+
+        drive = Drive(direction, power, duration, capped)
+        drive.issued_at = time.monotonic()
+        self.heartbeat()
+        self._commands.put(('drive', drive.issued_at, drive, not wait))
+
+        if wait:
+            run_time = min(duration, self.max_run_seconds)
+            if not drive.done.wait(run_time + DRIVE_STOP_MARGIN_SECONDS):
+                self._stop_after_timeout(drive, drive.issued_at + run_time)
+            if drive.stop_reason == 'error':
+                raise RuntimeError(f"Motor command failed: {drive.error}")
+        return drive
+
+    # requests a motor stop and waits briefly for it to happen
+    def stop(self, reason='requested', timeout=SIGNAL_STOP_WAIT_SECONDS):
+        if self._thread is None or not self._thread.is_alive():
+            self.backend.stop()
+            return True
+
+        done = threading.Event()
+        self._commands.put(('stop', time.monotonic(), done, reason))
+        if done.wait(timeout):
+            return True
+
+        print("Motor supervisor did not respond, stopping motors directly")
+        self.backend.stop()
+        return False
+
+    # installs sigint and sigterm handlers that stop the motors first
+    def install_signal_handlers(self):
+        signal.signal(signal.SIGINT, self._handle_signal)
+        signal.signal(signal.SIGTERM, self._handle_signal)
+
+    # returns the count and worst-case latency of stops that turned running
+    # motors off
+    def stats(self):
+        with self._lock:
+            return {
+                'stops': self._stop_count,
+                'worst_stop_latency': self._worst_stop_latency,
+                'worst_stop_reason': self._worst_stop_reason,
+                'last_stop_reason': self._last_stop_reason
+            }
+
+    # stops the motors from the calling thread when the supervisor missed a deadline
+    def _stop_after_timeout(self, drive, due_at):
+        print("Motor supervisor did not respond, stopping motors directly")
+        self.backend.stop()
+
+        stopped_at = time.monotonic()
+        if self._complete_drive(drive, 'timeout', stopped_at - drive.issued_at):
+            self._record_stop('timeout', stopped_at - due_at)
+
+    def _handle_signal(self, signum, frame):
+        self.stop(reason=signal.Signals(signum).name)
+
+        if signum == signal.SIGINT:
+            raise KeyboardInterrupt
+        raise SystemExit(128 + signum)
+
+    # main loop of the supervisor thread
+    def _run(self):
+        while True:
+            try:
+                command = self._commands.get(timeout=self._time_until_next_check())
+            except queue.Empty:
+                command = None
+
+            if command is not None:
+                if command[0] == 'shutdown':
+                    self._stop_motors('shutdown', command[1])
+                    break
+                self._handle_command(command)
+
+            self._enforce_limits()
+
+    # seconds until the running motors must be checked, or None when idle
+    def _time_until_next_check(self):
+        if not self._running:
+            return None
+
+        next_check = self._deadline
+        if self._watch_heartbeat:
+            next_check = min(next_check, self._last_heartbeat + self.heartbeat_timeout)
+        return max(0.0, next_check - time.monotonic())
+
+    def _handle_command(self, command):
+        name, issued_at = command[0], command[1]
+
+        if name == 'stop':
+            self._stop_motors(command[3], issued_at)
+            command[2].set()
+            return
+
+        drive, watch_heartbeat = command[2], command[3]
+        self._finish_drive('superseded', time.monotonic())
+
+        try:
+            if drive.direction == 'forward':
+                self.backend.forward(drive.power)
+            else:
+                self.backend.backward(drive.power)
+        except Exception as e:
+            drive.error = e
+            self._active_drive = drive
+            self._stop_motors('error', time.monotonic())
+            return
+
+        # the caller already stopped this drive after a timeout, so undo the
+        # motor command that just came back late
+        if drive.done.is_set():
+            self._running = True
+            self._stop_motors('timeout', time.monotonic())
+            return
+
+        drive.started_at = time.monotonic()
+        self._running = True
+        self._deadline = issued_at + min(drive.requested, self.max_run_seconds)
+        self._watch_heartbeat = watch_heartbeat
+        self._active_drive = drive
+
+    # stops the motors if the deadline or heartbeat has been missed
+    def _enforce_limits(self):
+        if not self._running:
+            return
+
+        now = time.monotonic()
+        heartbeat_expiry = self._last_heartbeat + self.heartbeat_timeout
+
+        if now >= self._deadline:
+            self._stop_motors('deadline', self._deadline)
+        elif self._watch_heartbeat and now >= heartbeat_expiry:
+            self._stop_motors('heartbeat', heartbeat_expiry)
+
+    # stops the motors and records how late the stop was if they were running
+    def _stop_motors(self, reason, due_at):
+        was_running = self._running
+
+        try:
+            self.backend.stop()
+        except Exception as e:
+            print(f"Motor stop failed: {e}")
+
+        stopped_at = time.monotonic()
+
+        self._running = False
+        self._deadline = None
+        self._watch_heartbeat = False
+        self._finish_drive(reason, stopped_at)
+        if was_running:
+            self._record_stop(reason, stopped_at - due_at)
+
+    # counts a stop and keeps the worst latency seen
+    def _record_stop(self, reason, latency):
+        latency = max(0.0, latency)
+        with self._lock:
+            self._stop_count += 1
+            self._last_stop_reason = reason
+            if latency >= self._worst_stop_latency:
+                self._worst_stop_latency = latency
+                self._worst_stop_reason = reason
+
+    # records how long the active drive ran and wakes anyone waiting on it
+    def _finish_drive(self, reason, stopped_at):
+        drive = self._active_drive
+        if drive is None:
+            return
+
+        driven = 0.0
+        if drive.started_at is not None:
+            driven = stopped_at - drive.started_at
+        self._active_drive = None
+        self._complete_drive(drive, reason, driven)
+
+    # marks a drive finished once, whichever thread gets there first
+    def _complete_drive(self, drive, reason, driven):
+        with self._lock:
+            if drive.done.is_set():
+                return False
+            drive.driven = driven
+            drive.stop_reason = reason
+            drive.done.set()
+            return True
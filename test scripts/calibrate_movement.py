@@ -1,20 +1,23 @@
-import picar_4wd as fc
+import os
+import sys
 import time
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor_supervisor import MotorSupervisor
+
 POWER = 50
 TEST_DURATION = 0.5
 
+motors = MotorSupervisor()
+
 # moves the car forward for a given duration
 def move_forward(duration, power=POWER):
-    fc.forward(power)
-    time.sleep(duration)
-    fc.stop()
+    motors.drive('forward', power, duration)
 
 # moves the car backward for a given duration
 def move_backward(duration, power=POWER):
-    fc.backward(power)
-    time.sleep(duration)
-    fc.stop()
+    motors.drive('backward', power, duration)
 
 # interactive calibration mode for testing car movement
 def run_calibration_test():
@@ -45,7 +48,7 @@ def run_calibration_test():
                 break
             
             elif command == 's':
-                fc.stop()
+                motors.stop()
                 print("Motors stopped.")
             
             elif command == 't':
@@ -83,11 +86,11 @@ def run_calibration_test():
                 print("Unknown command. Use f, b, t, s, or q.")
                 
         except KeyboardInterrupt:
-            fc.stop()
+            motors.stop()
             print("\n\nEmergency stop! Motors stopped.")
             break
         except Exception as e:
-            fc.stop()
+            motors.stop()
             print(f"\nError: {e}")
             print("Motors stopped for safety.")
 
@@ -104,21 +107,25 @@ def quick_test():
     print("\nQuick test complete!")
 
 if __name__ == "__main__":
-    print()
-    print("What would you like to do?")
-    print("  1. Quick test (forward then backward)")
-    print("  2. Interactive calibration mode")
-    print()
-    
-    choice = input("Enter 1 or 2: ").strip()
-    
-    if choice == '1':
-        quick_test()
-    elif choice == '2':
-        run_calibration_test()
-    else:
-        print("Invalid choice. Running quick test by default.")
-        quick_test()
+    motors.start()
+    motors.install_signal_handlers()
     
-    fc.stop()
-    print("\nMotors stopped. Script ended.")
\ No newline at end of file
+    try:
+        print()
+        print("What would you like to do?")
+        print("  1. Quick test (forward then backward)")
+        print("  2. Interactive calibration mode")
+        print()
+        
+        choice = input("Enter 1 or 2: ").strip()
+        
+        if choice == '1':
+            quick_test()
+        elif choice == '2':
+            run_calibration_test()
+        else:
+            print("Invalid choice. Running quick test by default.")
+            quick_test()
+    finally:
+        motors.close()
+        print("\nMotors stopped. Script ended.")
\ No newline at end of file
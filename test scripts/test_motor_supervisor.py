@@ -0,0 +1,299 @@
+import os
+import signal
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor_supervisor import DRIVE_STOP_MARGIN_SECONDS, MotorSupervisor
+
+# generous bound so the checks hold on a loaded machine
+MAX_STOP_LATENCY = 0.25
+
+worst_latencies = []
+
+# stands in for picar_4wd and records every motor call
+class FakeMotors:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _record(self, name, power=None):
+        with self.lock:
+            self.calls.append((name, power, time.monotonic()))
+
+    def forward(self, power):
+        self._record('forward', power)
+
+    def backward(self, power):
+        self._record('backward', power)
+
+    def stop(self):
+        self._record('stop')
+
+    def is_running(self):
+        with self.lock:
+            return bool(self.calls) and self.calls[-1][0] != 'stop'
+
+# fake motors whose forward call turns the motors on and then hangs until released
+class HangingMotors(FakeMotors):
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def forward(self, power):
+        self._record('forward', power)
+        self.release.wait(5.0)
+
+# fake motors whose forward call fails like a broken i2c bus
+class FailingMotors(FakeMotors):
+    def forward(self, power):
+        raise OSError("I2C write failed")
+
+# prints and keeps the worst stop latency a test saw
+def report(stats):
+    worst_latencies.append(stats['worst_stop_latency'])
+    print(f"    worst stop latency {stats['worst_stop_latency'] * 1000:.2f} ms ({stats['worst_stop_reason']})")
+
+# creates a started supervisor with a fake backend
+def make_supervisor(motors_class=FakeMotors, **kwargs):
+    motors = motors_class()
+    supervisor = MotorSupervisor(backend=motors, **kwargs)
+    supervisor.start()
+    return supervisor, motors
+
+# waits until a condition is true or the timeout runs out
+def wait_until(condition, timeout=2.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+# delivers a real signal with the supervisor's handlers installed and
+# returns the exception the handler raised
+def send_signal(supervisor, signum):
+    previous_int = signal.getsignal(signal.SIGINT)
+    previous_term = signal.getsignal(signal.SIGTERM)
+    supervisor.install_signal_handlers()
+
+    try:
+        os.kill(os.getpid(), signum)
+        time.sleep(2.0)
+    except (KeyboardInterrupt, SystemExit) as e:
+        return e
+    finally:
+        signal.signal(signal.SIGINT, previous_int)
+        signal.signal(signal.SIGTERM, previous_term)
+    return None
+
+# checks a drive stops at its deadline
+def test_drive_stops_at_deadline():
+    supervisor, motors = make_supervisor()
+    drive = supervisor.drive('forward', 50, 0.2)
+    supervisor.close()
+
+    assert motors.calls[0][:2] == ('forward', 50)
+    assert motors.calls[1][0] == 'stop'
+    assert drive.stop_reason == 'deadline'
+    assert not drive.capped
+    assert 0.2 - MAX_STOP_LATENCY < drive.driven < 0.2 + MAX_STOP_LATENCY
+    stats = supervisor.stats()
+    assert stats['worst_stop_reason'] == 'deadline'
+    assert stats['worst_stop_latency'] < MAX_STOP_LATENCY
+    report(stats)
+
+# checks long drives are capped by the max run time
+def test_drive_is_capped():
+    supervisor, motors = make_supervisor(max_run_seconds=0.1)
+    drive = supervisor.drive('backward', 50, 5.0)
+    supervisor.close()
+
+    assert motors.calls[0][0] == 'backward'
+    assert drive.capped
+    assert drive.stop_reason == 'deadline'
+    assert drive.driven < 0.1 + MAX_STOP_LATENCY
+    report(supervisor.stats())
+
+# checks motors stop when the caller stops sending heartbeats
+def test_missed_heartbeat_stops_motors():
+    supervisor, motors = make_supervisor(heartbeat_timeout=0.1)
+    drive = supervisor.drive('forward', 50, 5.0, wait=False)
+
+    assert drive.done.wait(5.0)
+    assert not motors.is_running()
+    stats = supervisor.stats()
+    supervisor.close()
+
+    assert drive.stop_reason == 'heartbeat'
+    assert stats['last_stop_reason'] == 'heartbeat'
+    assert stats['worst_stop_latency'] < MAX_STOP_LATENCY
+    report(stats)
+
+# checks blocking drives are bounded by their deadline, not the heartbeat
+def test_blocking_drive_ignores_heartbeat():
+    supervisor, motors = make_supervisor(heartbeat_timeout=0.05)
+    drive = supervisor.drive('forward', 50, 0.2)
+    stats = supervisor.stats()
+    supervisor.close()
+
+    assert drive.stop_reason == 'deadline'
+    assert stats['last_stop_reason'] == 'deadline'
+    report(stats)
+
+# checks an explicit stop interrupts a running drive
+def test_stop_interrupts_drive():
+    supervisor, motors = make_supervisor()
+    drive = supervisor.drive('forward', 50, 5.0, wait=False)
+    assert wait_until(motors.is_running)
+
+    assert supervisor.stop(reason='requested')
+    assert drive.done.is_set()
+    assert not motors.is_running()
+    stats = supervisor.stats()
+    supervisor.close()
+
+    assert drive.stop_reason == 'requested'
+    assert stats['last_stop_reason'] == 'requested'
+    report(stats)
+
+# checks stops while the motors are idle are not counted
+def test_idle_stops_are_not_counted():
+    supervisor, motors = make_supervisor()
+    supervisor.drive('forward', 50, 0.1)
+
+    assert supervisor.stop()
+    supervisor.close()
+
+    stats = supervisor.stats()
+    assert stats['stops'] == 1
+    assert stats['last_stop_reason'] == 'deadline'
+    assert motors.calls[-1][0] == 'stop'
+    report(stats)
+
+# checks a blocking drive still stops on time when the supervisor hangs
+def test_drive_times_out_when_supervisor_hangs():
+    supervisor, motors = make_supervisor(HangingMotors)
+    start = time.monotonic()
+    drive = supervisor.drive('forward', 50, 0.1)
+    elapsed = time.monotonic() - start
+
+    assert not motors.is_running()
+    assert drive.stop_reason == 'timeout'
+    assert elapsed < 0.1 + DRIVE_STOP_MARGIN_SECONDS + MAX_STOP_LATENCY
+    stats = supervisor.stats()
+    assert stats['worst_stop_reason'] == 'timeout'
+    assert stats['worst_stop_latency'] < DRIVE_STOP_MARGIN_SECONDS + MAX_STOP_LATENCY
+
+    motors.release.set()
+    assert wait_until(lambda: supervisor.stats()['stops'] == 2)
+    assert not motors.is_running()
+    assert drive.stop_reason == 'timeout'
+    supervisor.close()
+    report(stats)
+
+# checks stop() stops the motors itself when the supervisor hangs
+def test_stop_falls_back_when_supervisor_hangs():
+    supervisor, motors = make_supervisor(HangingMotors)
+    supervisor.drive('forward', 50, 5.0, wait=False)
+    assert wait_until(motors.is_running)
+
+    start = time.monotonic()
+    assert not supervisor.stop(timeout=0.1)
+    elapsed = time.monotonic() - start
+
+    assert not motors.is_running()
+    assert elapsed < 0.1 + MAX_STOP_LATENCY
+    motors.release.set()
+    supervisor.close()
+
+# checks close() stops the motors itself when the supervisor hangs
+def test_close_falls_back_when_supervisor_hangs():
+    supervisor, motors = make_supervisor(HangingMotors)
+    supervisor.drive('forward', 50, 5.0, wait=False)
+    assert wait_until(motors.is_running)
+
+    start = time.monotonic()
+    supervisor.close(timeout=0.1)
+    elapsed = time.monotonic() - start
+
+    assert not motors.is_running()
+    assert elapsed < 0.1 + MAX_STOP_LATENCY
+    motors.release.set()
+
+# checks a failed motor command raises and leaves the motors stopped
+def test_backend_error_raises():
+    supervisor, motors = make_supervisor(FailingMotors)
+
+    try:
+        supervisor.drive('forward', 50, 0.2)
+        raised = None
+    except RuntimeError as e:
+        raised = e
+
+    assert raised is not None
+    assert "I2C write failed" in str(raised)
+    assert motors.calls[-1][0] == 'stop'
+    assert supervisor.stats()['stops'] == 0
+    supervisor.close()
+
+# checks a real sigint stops the motors and raises keyboard interrupt
+def test_sigint_stops_motors():
+    supervisor, motors = make_supervisor()
+    drive = supervisor.drive('forward', 50, 5.0, wait=False)
+    assert wait_until(motors.is_running)
+
+    error = send_signal(supervisor, signal.SIGINT)
+
+    assert isinstance(error, KeyboardInterrupt)
+    assert not motors.is_running()
+    assert drive.stop_reason == 'SIGINT'
+    stats = supervisor.stats()
+    supervisor.close()
+    report(stats)
+
+# checks a real sigterm stops the motors and exits with 128 + SIGTERM
+def test_sigterm_stops_motors():
+    supervisor, motors = make_supervisor()
+    drive = supervisor.drive('forward', 50, 5.0, wait=False)
+    assert wait_until(motors.is_running)
+
+    error = send_signal(supervisor, signal.SIGTERM)
+
+    assert isinstance(error, SystemExit)
+    assert error.code == 128 + signal.SIGTERM
+    assert not motors.is_running()
+    assert drive.stop_reason == 'SIGTERM'
+    stats = supervisor.stats()
+    supervisor.close()
+    report(stats)
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("MOTOR SUPERVISOR TEST (fake motors)")
+    print("=" * 60)
+
+    tests = [
+        test_drive_stops_at_deadline,
+        test_drive_is_capped,
+        test_missed_heartbeat_stops_motors,
+        test_blocking_drive_ignores_heartbeat,
+        test_stop_interrupts_drive,
+        test_idle_stops_are_not_counted,
+        test_drive_times_out_when_supervisor_hangs,
+        test_stop_falls_back_when_supervisor_hangs,
+        test_close_falls_back_when_supervisor_hangs,
+        test_backend_error_raises,
+        test_sigint_stops_motors,
+        test_sigterm_stops_motors,
+    ]
+
+    for test in tests:
+        print(f"\n{test.__name__}")
+        test()
+        print("  PASS")
+
+    print("\n" + "-" * 60)
+    print(f"Worst-case stop latency across all tests: {max(worst_latencies) * 1000:.2f} ms")